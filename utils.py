@@ -3,9 +3,38 @@ from pydicom.pixel_data_handlers.util import apply_voi_lut, apply_modality_lut
 import cv2
 import numpy as np
 from pathlib import Path
+import collections
+import io
 import os
+import functools
 import concurrent.futures
 
+# numba is optional: when present, the final normalize step runs as a fused
+# parallel kernel; otherwise the numpy fallback below is used
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _preload_pydicom():
+    """
+    executor initializer
+    touch pydicom's data dictionaries once per worker process,
+    instead of lazily on the first dcmread of every worker task
+    """
+    from pydicom.datadict import DicomDictionary
+    from pydicom.uid import UID_dictionary
+    len(DicomDictionary), len(UID_dictionary)
+
+
+# SOP classes excluded from conversion, by UID
+# one hash lookup per file, and new exclusions are a dict entry away
+_UNSUPPORTED_SOP_CLASSES = {
+    '1.2.840.10008.5.1.4.1.1.104.1': 'Encapsulated PDF Storage',
+    '1.2.840.10008.5.1.4.1.1.88.59': 'Key Object Selection Document',
+}
+
 
 def _is_unsupported(ds):
     """
@@ -13,68 +42,231 @@ def _is_unsupported(ds):
     if unsupported, return SOP class name
     if supported, return False
     """
-    # to exclude unsupported SOP class by its UID
-    # PDF
-    if ds.SOPClassUID == '1.2.840.10008.5.1.4.1.1.104.1':
-        return 'Encapsulated PDF Storage'
-    # exclude object selection document
-    elif ds.SOPClassUID == '1.2.840.10008.5.1.4.1.1.88.59':
-        return 'Key Object Selection Document'
-    else:
-        return False
+    return _UNSUPPORTED_SOP_CLASSES.get(str(ds.SOPClassUID), False)
 
 
 def _pixel_process(ds, pixel_array):
     """
     Process the images
     input image info and original pixeal_array
-    applying LUTs: Modality LUT -> VOI LUT -> Presentation LUT    
+    applying LUTs: Modality LUT -> VOI LUT -> Presentation LUT
     return processed pixel_array, in 8bit; RGB if color
     """
 
+    # fast path: grayscale integer images with plain linear windowing can be
+    # converted through a precomputed per-value LUT instead of full-image float math
+    if _can_use_windowing_LUT(ds, pixel_array):
+        return _apply_windowing_LUT(ds, pixel_array)
+
+    # otherwise run the general float pipeline
+    # float32 keeps enough precision for windowing/LUTs and halves memory traffic vs float64
+    pixel_array = _float32_scratch(pixel_array)
+
     # LUTs: Modality LUT -> VOI LUT -> Presentation LUT
     # Modality LUT, Rescale slope, Rescale Intercept
     if 'RescaleSlope' in ds and 'RescaleIntercept' in ds:
         # try applying rescale slope/intercept
-        # cannot use INT, because rescale slope could be<1 
-        rescale_slope = float(ds.RescaleSlope)  # int(ds.RescaleSlope)
-        rescale_intercept = float(ds.RescaleIntercept)  # int(ds.RescaleIntercept)
-        pixel_array = pixel_array * rescale_slope + rescale_intercept
+        # cannot use INT, because rescale slope could be<1
+        # keep float32 so intermediates stay in single precision
+        rescale_slope = np.float32(ds.RescaleSlope)  # int(ds.RescaleSlope)
+        rescale_intercept = np.float32(ds.RescaleIntercept)  # int(ds.RescaleIntercept)
+        # in-place: avoid allocating a new image-sized temporary per step
+        np.multiply(pixel_array, rescale_slope, out=pixel_array)
+        np.add(pixel_array, rescale_intercept, out=pixel_array)
     else:
-        # otherwise, try to apply modality 
-        pixel_array = apply_modality_lut(pixel_array, ds)
+        # otherwise, try to apply modality
+        # pydicom may hand back float64; drop back to float32
+        pixel_array = apply_modality_lut(pixel_array, ds).astype(np.float32, copy=False)
 
     # personally prefer sigmoid function than window/level
     # personally prefer LINEAR_EXACT than LINEAR (prone to err if small window/level, such as some MR images)
     if 'VOILUTFunction' in ds and ds.VOILUTFunction == 'SIGMOID':
-        pixel_array = apply_voi_lut(pixel_array, ds)
+        # in-place decomposition of y_range / (1 + exp(-4*(x - c)/w)) + y_min
+        # apply_voi_lut computes the same curve through several temporaries;
+        # the output range does not matter here since normalization follows
+        window_center, window_width = _get_window_center_width(ds)
+        np.subtract(pixel_array, np.float32(window_center), out=pixel_array)
+        np.multiply(pixel_array, np.float32(-4.0 / window_width), out=pixel_array)
+        np.exp(pixel_array, out=pixel_array)
+        np.add(pixel_array, np.float32(1.0), out=pixel_array)
+        np.reciprocal(pixel_array, out=pixel_array)
+        np.multiply(pixel_array, np.float32(255.0), out=pixel_array)
     elif 'WindowCenter' in ds and 'WindowWidth' in ds:
-        window_center = ds.WindowCenter
-        window_width = ds.WindowWidth
-        # some values may be stored in an array
-        if type(window_center) == pydicom.multival.MultiValue:
-            window_center = float(window_center[0])
-        else:
-            window_center = float(window_center)
-        if type(window_width) == pydicom.multival.MultiValue:
-            window_width = float(window_width[0])
-        else:
-            window_width = float(window_width)
+        window_center, window_width = _get_window_center_width(ds)
         pixel_array = _get_LUT_value_LINEAR_EXACT(pixel_array, window_width, window_center)
     else:
         # if there is no window center, window width tag, try applying VOI LUT setting
         pixel_array = apply_voi_lut(pixel_array, ds)
 
     # Presentation VOI
-    # normalize to 8 bit
-    pixel_array = ((pixel_array - pixel_array.min()) / (pixel_array.max() - pixel_array.min())) * 255.0
-    # if PhotometricInterpretation == "MONOCHROME1", then inverse; eg. xrays
-    if 'PhotometricInterpretation' in ds and ds.PhotometricInterpretation == "MONOCHROME1":
-        # NOT add minus directly
-        pixel_array = np.max(pixel_array) - pixel_array
+    # normalize to 8 bit; if PhotometricInterpretation == "MONOCHROME1",
+    # then inverse; eg. xrays
+    invert = 'PhotometricInterpretation' in ds and ds.PhotometricInterpretation == "MONOCHROME1"
+    return _normalize_to_u8(pixel_array, invert)
+
+
+# per-process float32 working buffers, keyed by shape; slices in a series
+# share a shape, so after the first file a worker reuses the same pages
+# instead of allocating (and fault-mapping) a fresh array every time
+_SCRATCH = {}
+
+
+def _float32_scratch(pixel_array):
+    """
+    copy pixel data into a reusable per-process float32 buffer
+    also guarantees the working array never aliases pydicom's cached
+    pixel_array, which the in-place pipeline would otherwise corrupt
+    """
+    buffer = _SCRATCH.get(pixel_array.shape)
+    if buffer is None or buffer.dtype != np.float32:
+        buffer = np.empty(pixel_array.shape, dtype=np.float32)
+        _SCRATCH[pixel_array.shape] = buffer
+    np.copyto(buffer, pixel_array, casting='unsafe')
+    return buffer
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _normalize_to_u8_kernel(flat, out, invert):
+        """single fused pass: parallel min/max reduction, then affine map + invert"""
+        minimum = flat[0]
+        maximum = flat[0]
+        for i in prange(flat.size):
+            value = flat[i]
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+        scale = 255.0 / (maximum - minimum) if maximum > minimum else 0.0
+        for i in prange(flat.size):
+            value = (flat[i] - minimum) * scale
+            if invert:
+                value = 255.0 - value
+            out[i] = np.uint8(value)
+
+
+def _normalize_to_u8(pixel_array, invert):
+    """
+    Normalize to 8 bit, optionally inverting (MONOCHROME1)
+    with numba: one reduction pass + one write pass over the image
+    without: in-place numpy ops, one extra pass for the inversion
+    """
+    if njit is not None:
+        pixel_array = np.ascontiguousarray(pixel_array, dtype=np.float32)
+        out = np.empty(pixel_array.shape, dtype=np.uint8)
+        _normalize_to_u8_kernel(pixel_array.ravel(), out.ravel(), invert)
+        return out
+
+    # cv2.normalize fuses the min/max reduction, scaling, and uint8 cast in
+    # one SIMD kernel; fed a flat view so stacked volumes work too, since
+    # cv2 would read a 3rd axis as channels
+    pixel_array = np.ascontiguousarray(pixel_array, dtype=np.float32)
+    out = np.empty(pixel_array.size, dtype=np.uint8)
+    cv2.normalize(pixel_array.reshape(-1), out, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
+    if invert:
+        # normalization guarantees the full 0-255 range, so the inversion is
+        # exactly the byte complement: one pass, no max() reduction
+        cv2.bitwise_not(out, out)
+    return out.reshape(pixel_array.shape)
+
+
+def _get_window_center_width(ds):
+    """
+    extract window center(level) and width as floats
+    np.atleast_1d handles scalar and MultiValue storage uniformly
+    """
+    window_center = float(np.atleast_1d(ds.WindowCenter)[0])
+    window_width = float(np.atleast_1d(ds.WindowWidth)[0])
+    return window_center, window_width
+
+
+def _is_plain_8bit(ds, pixel_array):
+    """
+    check if the image is already displayable 8 bit with no LUT to apply
+    (typical for secondary capture / ultrasound); such files can skip
+    _pixel_process entirely
+    """
+    if pixel_array.dtype != np.uint8:
+        return False
+    if getattr(ds, 'BitsStored', 8) != 8:
+        return False
+    # any of these would change the pixel values
+    for tag in ('RescaleSlope', 'ModalityLUTSequence', 'WindowCenter', 'WindowWidth',
+                'VOILUTFunction', 'VOILUTSequence'):
+        if tag in ds:
+            return False
+    # MONOCHROME1 still needs the inversion in _pixel_process
+    if 'PhotometricInterpretation' in ds and ds.PhotometricInterpretation == 'MONOCHROME1':
+        return False
+    return True
+
+
+def _can_use_windowing_LUT(ds, pixel_array):
+    """
+    check if the image can go through the per-value LUT fast path:
+    grayscale integer pixels (<=16 bit), linear window center/width,
+    no Modality LUT sequence, no sigmoid VOI, and not MONOCHROME1
+    """
+    # 2D grayscale, or a stacked (N, H, W) grayscale series volume
+    # ([x, x, 3] means color, handled by the float path)
+    if not (pixel_array.ndim == 2 or (pixel_array.ndim == 3 and pixel_array.shape[2] != 3)):
+        return False
+    if not (pixel_array.dtype.kind in 'iu' and pixel_array.dtype.itemsize <= 2):
+        return False
+    if 'WindowCenter' not in ds or 'WindowWidth' not in ds:
+        return False
+    if 'ModalityLUTSequence' in ds:
+        return False
+    if 'VOILUTFunction' in ds and ds.VOILUTFunction == 'SIGMOID':
+        return False
+    if 'PhotometricInterpretation' in ds and ds.PhotometricInterpretation == 'MONOCHROME1':
+        return False
+    # a negative rescale slope would break the monotonicity the LUT relies on
+    if 'RescaleSlope' in ds and float(ds.RescaleSlope) <= 0:
+        return False
+    return True
+
 
-    # conver float -> 8-bit
-    return pixel_array.astype('uint8')
+def _apply_windowing_LUT(ds, pixel_array):
+    """
+    Rescale + window + normalize integer images through a per-value LUT
+    A <=16 bit image has at most 65536 distinct values, so the float math is
+    done once per value on a small table instead of once per pixel, and the
+    image itself is converted with a single uint8 gather
+    """
+    window_center, window_width = _get_window_center_width(ds)
+    if 'RescaleSlope' in ds and 'RescaleIntercept' in ds:
+        rescale_slope = np.float32(ds.RescaleSlope)
+        rescale_intercept = np.float32(ds.RescaleIntercept)
+    else:
+        rescale_slope = np.float32(1)
+        rescale_intercept = np.float32(0)
+
+    # table over the dtype's full domain, ordered by the raw bit pattern so
+    # signed arrays can index it through a free reinterpreting view
+    unsigned_dtype = np.dtype(f'u{pixel_array.dtype.itemsize}')
+    table = np.arange(1 << (8 * pixel_array.dtype.itemsize), dtype=unsigned_dtype)
+    table = table.view(pixel_array.dtype).astype(np.float32)
+    np.multiply(table, rescale_slope, out=table)
+    np.add(table, rescale_intercept, out=table)
+
+    # window against the image's own extremes so the result matches the float path
+    def bit_index(value):
+        return np.asarray([value], dtype=pixel_array.dtype).view(unsigned_dtype)[0]
+
+    index_min = bit_index(pixel_array.min())
+    index_max = bit_index(pixel_array.max())
+    table = _get_LUT_value_LINEAR_EXACT(table, window_width, window_center,
+                                        data_min=table[index_min], data_max=table[index_max])
+
+    # normalize to 8 bit; by monotonicity the windowed image extremes are the
+    # table entries at the raw image extremes
+    table_min = table[index_min]
+    table_max = table[index_max]
+    np.subtract(table, table_min, out=table)
+    np.multiply(table, 255.0 / (table_max - table_min), out=table)
+    np.clip(table, 0, 255, out=table)
+    table = table.astype('uint8')
+
+    return table[pixel_array.view(unsigned_dtype)]
 
 
 def _get_LUT_value_LINEAR_normalized(data, window, level):
@@ -97,29 +289,67 @@ def _get_LUT_value_LINEAR_EXACT_normalized(data, window, level):
     Adjust according to VOI LUT, window center(level) and width values
     Normalized to 8 bit
     """
-    data = np.piecewise(data,
-                        [data <= (level - (window) / 2),
-                         data > (level + (window) / 2)],
-                        [0, 255, lambda data: ((data - level + window / 2) / window * 255)])
-    return np.clip(data, a_min=0, a_max=255)
+    # the ramp is monotonic, so clipping the affine map gives the same result as
+    # np.piecewise without its per-branch masks (2 image-sized bool temporaries)
+    np.subtract(data, level - window / 2, out=data)
+    np.multiply(data, 255.0 / window, out=data)
+    np.clip(data, 0, 255, out=data)
+    return data
 
 
-def _get_LUT_value_LINEAR_EXACT(data, window, level):
+def _get_LUT_value_LINEAR_EXACT(data, window, level, data_min=None, data_max=None):
     """
     Adjust according to VOI LUT, window center(level) and width values
     not normalized
+    data_min/data_max default to the extremes of data itself; the LUT fast
+    path passes the image's extremes when data is a per-value table
     """
-    data_min = data.min()
-    data_max = data.max()
+    if data_min is None:
+        data_min = data.min()
+    if data_max is None:
+        data_max = data.max()
     data_range = data_max - data_min
-    data = np.piecewise(data,
-                        [data <= (level - (window) / 2),
-                         data > (level + (window) / 2)],
-                        [data_min, data_max,
-                         lambda data: ((data - level + window / 2) / window * data_range) + data_min])
+    # same clip-and-scale rewrite as the normalized variant: the piecewise
+    # plateaus are just the ramp clamped at data_min/data_max
+    np.subtract(data, level - window / 2, out=data)
+    np.multiply(data, data_range / window, out=data)
+    np.add(data, data_min, out=data)
+    np.clip(data, data_min, data_max, out=data)
     return data
 
 
+def _read_file_bytes(file_path):
+    """
+    read stage of the pipeline
+    a plain disk read releases the GIL, so several reads can overlap
+    with the CPU-bound convert stage
+    """
+    return file_path, Path(file_path).read_bytes()
+
+
+def _unsupported_message(file_path, ds_meta):
+    """
+    run the SOP class check on a metadata-only dataset
+    return the worker message if unsupported, None otherwise
+    """
+    is_unsupported = _is_unsupported(ds_meta)
+    if is_unsupported:
+        return f'{file_path} cannot be converted.\n{is_unsupported} is currently not supported'
+    return None
+
+
+def _ds_to_file_from_bytes(file_path, file_bytes, target_root, filetype, anonymous=None, patient_dict=None):
+    """convert stage of the pipeline: parse pre-read bytes and export"""
+    # cheap header-only parse first: unsupported files are rejected without
+    # ever materializing their PixelData element
+    ds_meta = pydicom.dcmread(io.BytesIO(file_bytes), stop_before_pixels=True, force=True)
+    rv = _unsupported_message(file_path, ds_meta)
+    if rv is not None:
+        return rv
+    ds = pydicom.dcmread(io.BytesIO(file_bytes), force=True)
+    return _ds_to_file_from_ds(ds, file_path, target_root, filetype, anonymous, patient_dict)
+
+
 def _ds_to_file(file_path, target_root, filetype, anonymous=None, patient_dict=None):
     """
     The aim of this function is to help multiprocessing
@@ -127,19 +357,30 @@ def _ds_to_file(file_path, target_root, filetype, anonymous=None, patient_dict=N
     return message for dicom convertor to print out
     """
 
+    # read metadata only and run the SOP class check before paying for the
+    # full parse; encapsulated-PDF and key-object files bail out here
+    ds_meta = pydicom.dcmread(file_path, stop_before_pixels=True, force=True, defer_size='1 KB')
+    rv = _unsupported_message(file_path, ds_meta)
+    if rv is not None:
+        return rv
+
     # read images and their pixel data
-    # if anonymous is True -> precalculate patient_dict -> passed as patient dict 
+    # if anonymous is True -> precalculate patient_dict -> passed as patient dict
     ds = pydicom.dcmread(file_path, force=True)
+    return _ds_to_file_from_ds(ds, file_path, target_root, filetype, anonymous, patient_dict)
 
-    # to exclude unsupported SOP class by its UID
-    is_unsupported = _is_unsupported(ds)
-    if is_unsupported:
-        rv = f'{file_path} cannot be converted.\n{is_unsupported} is currently not supported'
-        return rv
 
-    # load pixel_array 
+def _ds_to_file_from_ds(ds, file_path, target_root, filetype, anonymous=None, patient_dict=None):
+    """process an already-parsed, supported dataset and write the export file"""
+
+    # load pixel_array
     # *** This is one of the time-limited step  ***
-    pixel_array = ds.pixel_array.astype(float)  # preparing for scaling
+    # kept in the original dtype here; _pixel_process casts to float32 only
+    # when the integer LUT fast path does not apply
+    pixel_array = ds.pixel_array
+    # the decoded array is now the only pixel copy we need; dropping the raw
+    # PixelData bytes halves the peak footprint for large files
+    del ds.PixelData
 
     # if pixel_array.shape[2]==3 -> means color files [x,x,3]
     # [o,x,x] means multiframe
@@ -151,7 +392,10 @@ def _ds_to_file(file_path, target_root, filetype, anonymous=None, patient_dict=N
     #################
     # Process image #
     #################
-    pixel_array = _pixel_process(ds, pixel_array)
+    # already-8-bit files with no LUTs go straight to export
+    # (the color channel swap in _export_pixel_array still applies)
+    if not _is_plain_8bit(ds, pixel_array):
+        pixel_array = _pixel_process(ds, pixel_array)
 
     ##########################
     # convert to pixel image #
@@ -162,39 +406,123 @@ def _ds_to_file(file_path, target_root, filetype, anonymous=None, patient_dict=N
     ########################
     # Process to save file #
     ########################
+    return _export_pixel_array(ds, file_path, pixel_array, target_root, filetype, anonymous, patient_dict)
+
+
+def _export_pixel_array(ds, file_path, pixel_array, target_root, filetype, anonymous=None, patient_dict=None):
+    """encode a processed 8-bit array and write the export file"""
     # Color data already be converted by RGB implicitly by pydicom  
     # !!!!!!!! NOTE: only YBR_RCT, RGB are tested...
     # should be convert to "BGR" due to open-cv's RGB arrangement
     if 'PhotometricInterpretation' in ds and ds.PhotometricInterpretation in \
             ['YBR_RCT', 'RGB', 'YBR_ICT', 'YBR_PARTIAL_420', 'YBR_FULL_422', 'YBR_FULL', 'PALETTE COLOR']:
-        # pixel_array = cv2.cvtColor(np.float32(pixel_array), cv2.COLOR_RGB2BGR)
-        pixel_array[:, :, [0, 2]] = pixel_array[:, :, [2, 0]]
+        # cvtColor's SIMD channel deinterleave beats the fancy-index swap,
+        # which allocates a temporary and copies element by element
+        pixel_array = cv2.cvtColor(np.ascontiguousarray(pixel_array), cv2.COLOR_RGB2BGR)
+
+    # pick extension and encoder parameters for the requested file type
+    encode_params = []
+    extension = filetype
+    if filetype == 'jpg':
+        encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), 90]  # 70, 55
+    elif filetype == 'png_rle':
+        # RLE-strategy PNG: near-BMP encoding speed, but several times
+        # smaller on low-entropy (eg. windowed monochrome) images
+        encode_params = [cv2.IMWRITE_PNG_COMPRESSION, 1,
+                         cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE]
+        extension = 'png'
 
     # get full export file path and file name (anonynmous files are pre-calculated and stored in patient_dict)
-    full_export_fp_fn = _get_export_file_path(ds, file_path, target_root, filetype, anonymous, patient_dict)
+    full_export_fp_fn = _get_export_file_path(ds, file_path, target_root, extension, anonymous, patient_dict)
     # make dir
     Path.mkdir(full_export_fp_fn.parent, exist_ok=True, parents=True)
-    # write file
-    if filetype == 'jpg':
-        image_quality = [int(cv2.IMWRITE_JPEG_QUALITY), 90]  # 70, 55
-        cv2.imwrite(str(full_export_fp_fn), pixel_array, image_quality)
-    else:
-        cv2.imwrite(str(full_export_fp_fn), pixel_array)
+    # encode in memory, then flush with a single buffered write; avoids
+    # cv2.imwrite's own small unbuffered writes on the output file
+    encoded_ok, encoded = cv2.imencode('.' + extension, pixel_array, encode_params)
+    if not encoded_ok:
+        rv = f'{file_path} cannot be converted.\nEncoding to {filetype} failed'
+        return rv
+    full_export_fp_fn.write_bytes(encoded.tobytes())
 
     return True
 
 
-def _dicom_convertor(origin, target_root=None, filetype=None, anonymous=False, multiprocessing=True):
+def _group_by_series(dicom_file_list):
+    """
+    group file paths by SeriesInstanceUID via metadata-only reads
+    files without the tag form single-file groups
+    return a list of path lists, preserving the sorted file order
+    """
+    series_groups = {}
+    for file_path in dicom_file_list:
+        ds_meta = pydicom.dcmread(file_path, stop_before_pixels=True, force=True, defer_size='1 KB')
+        series_uid = str(getattr(ds_meta, 'SeriesInstanceUID', file_path))
+        series_groups.setdefault(series_uid, []).append(file_path)
+    return list(series_groups.values())
+
+
+def _series_signature(ds, pixel_array):
+    """the tags and array properties that must match for slices to be stacked"""
+    return (pixel_array.shape, pixel_array.dtype,
+            str(ds.get('RescaleSlope')), str(ds.get('RescaleIntercept')),
+            str(ds.get('WindowCenter')), str(ds.get('WindowWidth')),
+            str(ds.get('PhotometricInterpretation')), str(ds.get('VOILUTFunction')),
+            'ModalityLUTSequence' in ds, 'VOILUTSequence' in ds)
+
+
+def _series_to_files(file_path_list, target_root, filetype, anonymous=None, patient_dict=None):
+    """
+    convert one series as a single stacked volume
+    the pixel pipeline is ndim-agnostic, so windowing and normalization run
+    once over (N, H, W) instead of per slice, amortizing tag lookups and LUT
+    construction and giving every slice the same intensity scaling
+    falls back to per-file conversion when the slices are not homogeneous
+    return the list of per-file messages (True if OK)
+    """
+    datasets = [pydicom.dcmread(file_path, force=True) for file_path in file_path_list]
+
+    # only homogeneous stacks of supported 2D grayscale slices can be batched
+    batchable = all(_unsupported_message(fp, ds) is None for fp, ds in zip(file_path_list, datasets))
+    if batchable:
+        pixel_arrays = [ds.pixel_array for ds in datasets]
+        signature = _series_signature(datasets[0], pixel_arrays[0])
+        batchable = (pixel_arrays[0].ndim == 2
+                     and all(_series_signature(ds, arr) == signature
+                             for ds, arr in zip(datasets, pixel_arrays)))
+
+    if not batchable:
+        return_message = []
+        for file_path, ds in zip(file_path_list, datasets):
+            rv = _unsupported_message(file_path, ds)
+            if rv is None:
+                rv = _ds_to_file_from_ds(ds, file_path, target_root, filetype, anonymous, patient_dict)
+            return_message.append(rv)
+        return return_message
+
+    volume = np.stack(pixel_arrays)
+    # once the slices are stacked, the raw PixelData bytes of the whole
+    # series are dead weight; the per-file fallback path drops its own
+    for ds in datasets:
+        del ds.PixelData
+    if not _is_plain_8bit(datasets[0], volume):
+        volume = _pixel_process(datasets[0], volume)
+    return [_export_pixel_array(ds, file_path, slice_array, target_root, filetype, anonymous, patient_dict)
+            for ds, file_path, slice_array in zip(datasets, file_path_list, volume)]
+
+
+def _dicom_convertor(origin, target_root=None, filetype=None, anonymous=False, multiprocessing=True,
+                     batch_by_series=False):
     """
     origin: can be a .dcm file or a folder
     target_root: root of output files and folders; default: root of origin file or folder
-    filetype: can be jpg, jpeg, png, bmp, or ndarray
+    filetype: can be jpg, jpeg, png, png_rle (RLE-compressed png), bmp, or ndarray
+    batch_by_series: stack homogeneous series and process each as one volume
     full target file path = target_root/Today/PatientID_filetype/StudyDate_StudyTime_Modality_AccNum/Ser_Img.filetype
     """
     # set file type
     if filetype is None:
         filetype = 'bmp'
-    elif filetype.lower() not in ['jpg', 'png', 'jpeg', 'bmp', 'img', 'tiff']:
+    elif filetype.lower() not in ['jpg', 'png', 'png_rle', 'jpeg', 'bmp', 'img', 'tiff']:
         raise Exception('Target file type should be jpg, png, or bmp')
 
     # get root folder (as target_root) and dicom_file_list
@@ -202,11 +530,49 @@ def _dicom_convertor(origin, target_root=None, filetype=None, anonymous=False, m
     full_path_dict = None
 
     # process image and export files
-    if multiprocessing is True:
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            return_future = [executor.submit(_ds_to_file, file_path, target_root, filetype, anonymous, full_path_dict)
-                             for file_path in dicom_file_list]
-            return_message = [future.result() for future in return_future]
+    if batch_by_series is True:
+        # one task per series: vectorization across the stacked slices
+        # replaces per-file dispatch
+        series_lists = _group_by_series(dicom_file_list)
+        worker = functools.partial(_series_to_files, target_root=target_root, filetype=filetype,
+                                   anonymous=anonymous, patient_dict=full_path_dict)
+        if multiprocessing is True:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                        initializer=_preload_pydicom) as executor:
+                return_message = [message for messages in executor.map(worker, series_lists)
+                                  for message in messages]
+            print("Imagens DICOM convertidas em BMP com sucesso!")
+        else:
+            return_message = [message for series_files in series_lists
+                              for message in worker(series_files)]
+    elif multiprocessing is True:
+        # two-stage pipeline: a small thread pool prefetches file bytes (I/O
+        # bound, GIL released) while the process pool converts (CPU bound),
+        # so disk and cores stay busy at the same time
+        # raw bytes are what cross the process boundary: they pickle cheaply,
+        # unlike a parsed (or deferred-read) Dataset
+        worker = functools.partial(_ds_to_file_from_bytes, target_root=target_root, filetype=filetype,
+                                   anonymous=anonymous, patient_dict=full_path_dict)
+        max_workers = os.cpu_count()
+        prefetch = max_workers * 2  # bounds in-flight file buffers
+        read_queue = collections.deque()
+        convert_futures = collections.deque()
+        return_message = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as reader, \
+                concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                       initializer=_preload_pydicom) as executor:
+            for file_path in dicom_file_list:
+                read_queue.append(reader.submit(_read_file_bytes, file_path))
+                # once the prefetch window is full, hand the oldest read to the pool
+                if len(read_queue) >= prefetch:
+                    convert_futures.append(executor.submit(worker, *read_queue.popleft().result()))
+                # drain finished conversions so pending buffers stay bounded
+                if len(convert_futures) >= prefetch:
+                    return_message.append(convert_futures.popleft().result())
+            for read_future in read_queue:
+                convert_futures.append(executor.submit(worker, *read_future.result()))
+            for convert_future in convert_futures:
+                return_message.append(convert_future.result())
         print("Imagens DICOM convertidas em BMP com sucesso!")
     else:
         return_message = [_ds_to_file(file_path, target_root, filetype, anonymous, full_path_dict)
@@ -247,13 +613,7 @@ def _get_root_get_dicom_file_list(origin_input, target_root):
                 dicom_file_list.append(origin)
         # if it is a dir, then add all the dicom files into dicom_file_list
         elif origin.is_dir():
-            for root, sub_f, file in os.walk(origin):
-                for f in file:
-                    if f.lower().endswith('.dcm'):
-                        file_path_dcm = Path(root) / Path(f)
-                        # file_path_exp =  folder_destination / Path(f).with_suffix('.jpg')
-                        # stor origin / destination
-                        dicom_file_list.append(file_path_dcm)
+            _scan_dicom_files(origin, dicom_file_list)
     # sort the list
     dicom_file_list.sort()
 
@@ -271,6 +631,20 @@ def _get_root_get_dicom_file_list(origin_input, target_root):
     return root_folder, dicom_file_list
 
 
+def _scan_dicom_files(folder, dicom_file_list):
+    """
+    recursively collect .dcm files with os.scandir
+    scandir returns the entry type inline (no extra stat call per file,
+    unlike os.walk), and Path objects are only built for matching entries
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scan_dicom_files(entry.path, dicom_file_list)
+            elif entry.name.lower().endswith('.dcm'):
+                dicom_file_list.append(Path(entry.path))
+
+
 def _get_export_file_path(ds, file_path, target_root, filetype, anonymous, patient_dict):
     """construct export file path"""
 